@@ -15,17 +15,21 @@ Original file is located at
 # ============================================================================
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # Non-interactive backend: plots are only written to files
 import matplotlib.pyplot as plt
 import os
 from datetime import datetime
+from functools import lru_cache
 from matplotlib.ticker import MaxNLocator
 
 # ============================================================================
 # CONFIGURATION AND CONSTANTS
 # ============================================================================
 
-# Set matplotlib figure resolution for better quality plots
+# Set matplotlib figure and saved PNG resolution for better quality plots
 plt.rcParams["figure.dpi"] = 120
+plt.rcParams["savefig.dpi"] = 120
 
 # Equipment lifecycle parameters
 LIFETIME_YEARS = 10  # Total operational lifetime of equipment (years)
@@ -73,18 +77,65 @@ years = np.arange(0, LIFETIME_YEARS + 1)
 # CORE CALCULATION FUNCTIONS
 # ============================================================================
 
-def emissions_from_energy(energy_kwh, ef):
+@lru_cache(maxsize=None)
+def _build_scenario_arrays(sleep_frac, renewable_share, manufacturing_spread_local):
     """
-    Calculate CO2 emissions from energy consumption.
+    Calculate the annual emission arrays for one parameter combination.
+    
+    Results are memoized, so scenarios that repeat the same parameters reuse
+    the arrays instead of recomputing them. The returned arrays are read-only
+    because they are shared between callers.
     
     Parameters:
-        energy_kwh (float): Energy consumption in kilowatt-hours
-        ef (float): Emission factor in kg CO2 per kWh
+        sleep_frac (float): Fraction of operational energy reduced by sleep mode (0.0-1.0)
+        renewable_share (float): Fraction of operational energy from renewables (0.0-1.0)
+        manufacturing_spread_local (bool): Whether to amortize manufacturing emissions
     
     Returns:
-        float: Total CO2 emissions in kilograms
+        tuple: (components, totals) where components is an (n_years, 3) array of
+            manufacturing, operational and end-of-life emissions per year, and
+            totals is the matching array of annual totals
     """
-    return energy_kwh * ef
+    n_years = len(years)
+    
+    # --- Manufacturing Emissions ---
+    if manufacturing_spread_local:
+        # Amortize manufacturing emissions evenly across lifetime
+        annual_manufacturing_kwh = MANUFACTURING_ENERGY_KWH / LIFETIME_YEARS
+        manuf = np.full(n_years, annual_manufacturing_kwh * GRID_EMISSION_FACTOR)
+    else:
+        # Allocate all manufacturing emissions to year 0 (initial production)
+        manuf = np.zeros(n_years)
+        manuf[0] = MANUFACTURING_ENERGY_KWH * GRID_EMISSION_FACTOR
+    
+    # --- Operational Emissions ---
+    # Calculate weighted average emission factor based on renewable share
+    # Higher renewable share = lower effective emission factor
+    ef_operational = (renewable_share * RENEWABLE_EMISSION_FACTOR + 
+                      (1.0 - renewable_share) * GRID_EMISSION_FACTOR)
+    
+    # Operational emissions are identical every year, so compute once and broadcast
+    # Reduce energy consumption by sleep_frac (energy efficiency improvement)
+    op_energy = ANNUAL_OPERATIONAL_ENERGY_KWH * (1.0 - sleep_frac)
+    op = np.full(n_years, op_energy * ef_operational)
+    
+    # --- End-of-Life Emissions ---
+    # All EoL processing occurs in the final year
+    eol = np.zeros(n_years)
+    eol[-1] = EOL_ENERGY_KWH * RECYCLING_EMISSION_FACTOR
+    
+    # Gather components into one (n_years, 3) block and total them directly,
+    # rather than re-selecting the columns from the DataFrame afterwards
+    components = np.empty((n_years, 3))
+    components[:, 0] = manuf
+    components[:, 1] = op
+    components[:, 2] = eol
+    totals = components.sum(axis=1)
+    
+    # The cached arrays are shared, so protect them from in-place modification
+    components.flags.writeable = False
+    totals.flags.writeable = False
+    return components, totals
 
 
 def build_scenario_df(name, sleep_frac=0.0, renewable_share=0.0, 
@@ -111,49 +162,60 @@ def build_scenario_df(name, sleep_frac=0.0, renewable_share=0.0,
             - total_kgCO2: Sum of all emission sources
             - scenario: Scenario name
     """
-    # Initialize emission arrays for each lifecycle phase
-    manuf = np.zeros_like(years, dtype=float)
-    op = np.zeros_like(years, dtype=float)
-    eol = np.zeros_like(years, dtype=float)
+    components, totals = _build_scenario_arrays(
+        sleep_frac, renewable_share, manufacturing_spread_local
+    )
     
-    # --- Manufacturing Emissions ---
-    if manufacturing_spread_local:
-        # Amortize manufacturing emissions evenly across lifetime
-        annual_manufacturing_kwh = MANUFACTURING_ENERGY_KWH / LIFETIME_YEARS
-        manuf[:] = emissions_from_energy(annual_manufacturing_kwh, GRID_EMISSION_FACTOR)
-    else:
-        # Allocate all manufacturing emissions to year 0 (initial production)
-        manuf[0] = emissions_from_energy(MANUFACTURING_ENERGY_KWH, GRID_EMISSION_FACTOR)
+    # Construct DataFrame with all emission components and annual totals
+    df = pd.DataFrame({
+        "year": years,
+        "manufacturing_kgCO2": components[:, 0],
+        "operational_kgCO2": components[:, 1],
+        "eol_kgCO2": components[:, 2],
+        "total_kgCO2": totals,
+        "scenario": name
+    })
     
-    # --- Operational Emissions ---
-    # Calculate weighted average emission factor based on renewable share
-    # Higher renewable share = lower effective emission factor
-    ef_operational = (renewable_share * RENEWABLE_EMISSION_FACTOR + 
-                      (1.0 - renewable_share) * GRID_EMISSION_FACTOR)
+    return df
+
+
+def lifetime_emissions(sleep_frac, renewable_share,
+                       manufacturing_spread_local=manufacturing_spread):
+    """
+    Calculate total lifetime CO2 emissions in closed form.
     
-    # Calculate operational emissions for each year
-    for i, y in enumerate(years):
-        # Reduce energy consumption by sleep_frac (energy efficiency improvement)
-        op_energy = ANNUAL_OPERATIONAL_ENERGY_KWH * (1.0 - sleep_frac)
-        op[i] = emissions_from_energy(op_energy, ef_operational)
+    Equivalent to summing build_scenario_df(...)["total_kgCO2"], but built only
+    from element-wise NumPy arithmetic so that array arguments broadcast like a
+    ufunc (e.g. a column of sleep fractions against a row of renewable shares
+    yields the full sensitivity grid in one call).
     
-    # --- End-of-Life Emissions ---
-    # All EoL processing occurs in the final year
-    eol[-1] = emissions_from_energy(EOL_ENERGY_KWH, RECYCLING_EMISSION_FACTOR)
+    Parameters:
+        sleep_frac (float or np.ndarray): Fraction of operational energy reduced by sleep mode
+        renewable_share (float or np.ndarray): Fraction of operational energy from renewables
+        manufacturing_spread_local (bool): Whether to amortize manufacturing emissions
     
-    # Construct DataFrame with all emission components
-    df = pd.DataFrame({
-        "year": years,
-        "manufacturing_kgCO2": manuf,
-        "operational_kgCO2": op,
-        "eol_kgCO2": eol
-    })
+    Returns:
+        float or np.ndarray: Lifetime CO2 emissions in kilograms, broadcast
+            over the shapes of sleep_frac and renewable_share
+    """
+    n_years = len(years)
+    
+    # Manufacturing and EoL contributions do not depend on either parameter
+    if manufacturing_spread_local:
+        annual_manufacturing_kwh = MANUFACTURING_ENERGY_KWH / LIFETIME_YEARS
+        manuf_life = annual_manufacturing_kwh * GRID_EMISSION_FACTOR * n_years
+    else:
+        manuf_life = MANUFACTURING_ENERGY_KWH * GRID_EMISSION_FACTOR
+    eol_life = EOL_ENERGY_KWH * RECYCLING_EMISSION_FACTOR
     
-    # Calculate total annual emissions
-    df["total_kgCO2"] = df[["manufacturing_kgCO2", "operational_kgCO2", "eol_kgCO2"]].sum(axis=1)
-    df["scenario"] = name
+    ef_operational = (renewable_share * RENEWABLE_EMISSION_FACTOR +
+                      (1.0 - renewable_share) * GRID_EMISSION_FACTOR)
     
-    return df
+    # Build the operational term first, then update it in place
+    total = (1.0 - sleep_frac) * ef_operational
+    total *= n_years * ANNUAL_OPERATIONAL_ENERGY_KWH
+    total += manuf_life + eol_life
+    return total
 
 
 # ============================================================================
@@ -189,8 +251,10 @@ scenarios_defs = {
 # GENERATE ANNUAL AND CUMULATIVE RESULTS
 # ============================================================================
 
-# Build DataFrames for all scenarios
+# Build DataFrames for all scenarios, recording lifetime totals while each
+# small per-scenario frame is at hand
 list_df = []
+summary_rows = []
 for name, params in scenarios_defs.items():
     df_s = build_scenario_df(
         name, 
@@ -199,59 +263,61 @@ for name, params in scenarios_defs.items():
         manufacturing_spread_local=manufacturing_spread
     )
     list_df.append(df_s)
+    
+    life = df_s[["manufacturing_kgCO2", "operational_kgCO2", "eol_kgCO2", "total_kgCO2"]].to_numpy().sum(axis=0)
+    summary_rows.append({
+        "scenario": name,
+        "manufacturing_life_kgCO2": life[0],
+        "operational_life_kgCO2": life[1],
+        "eol_life_kgCO2": life[2],
+        "total_life_kgCO2": life[3]
+    })
+
+# Keep each scenario's frame keyed by name so later sections can reuse it
+# instead of re-filtering the combined results
+scenario_frames = dict(zip(scenarios_defs, list_df))
 
 # Combine all scenarios into a single DataFrame
-annual_results = pd.concat(list_df, ignore_index=True).sort_values(["scenario", "year"])
+annual_results = pd.concat(list_df, ignore_index=True)
+
+# Store scenario names as a categorical in definition order, so grouping,
+# sorting and equality masks on this column work on integer codes
+annual_results["scenario"] = pd.Categorical(annual_results["scenario"], categories=list(scenarios_defs))
+# No sort needed: frames are concatenated in scenario order and each one
+# already lists its years in ascending order
 
 # Calculate cumulative emissions over time for each scenario
-cumulative_results = annual_results.copy()
-cumulative_results["cumulative_total_kgCO2"] = cumulative_results.groupby("scenario")["total_kgCO2"].cumsum()
-cumulative_results["cumulative_operational_kgCO2"] = cumulative_results.groupby("scenario")["operational_kgCO2"].cumsum()
-cumulative_results["cumulative_manufacturing_kgCO2"] = cumulative_results.groupby("scenario")["manufacturing_kgCO2"].cumsum()
-cumulative_results["cumulative_eol_kgCO2"] = cumulative_results.groupby("scenario")["eol_kgCO2"].cumsum()
+# All four components are accumulated in one grouped pass; rows are already
+# grouped by scenario and ordered by year, so the groupby does not need to sort
+cumsum_cols = ["total_kgCO2", "operational_kgCO2", "manufacturing_kgCO2", "eol_kgCO2"]
+# Only the keys and running totals are kept; the annual values stay in annual_results
+cumulative_results = pd.concat(
+    [
+        annual_results[["year", "scenario"]],
+        annual_results.groupby("scenario", sort=False, observed=True)[cumsum_cols].cumsum().add_prefix("cumulative_"),
+    ],
+    axis=1
+)
 
 # ============================================================================
 # LIFETIME SUMMARY STATISTICS
 # ============================================================================
 
-# Calculate total lifetime emissions for each scenario
-summary_rows = []
-for name in scenarios_defs.keys():
-    df_s = annual_results[annual_results["scenario"] == name]
-    summary_rows.append({
-        "scenario": name,
-        "manufacturing_life_kgCO2": df_s["manufacturing_kgCO2"].sum(),
-        "operational_life_kgCO2": df_s["operational_kgCO2"].sum(),
-        "eol_life_kgCO2": df_s["eol_kgCO2"].sum(),
-        "total_life_kgCO2": df_s["total_kgCO2"].sum()
-    })
-
+# Total lifetime emissions for each scenario, summed while building the scenarios
 summary_df = pd.DataFrame(summary_rows).set_index("scenario")
 
 # Display lifetime totals sorted by total emissions
 print("\nLifetime totals (kgCO2):")
 print(summary_df["total_life_kgCO2"].sort_values())
 
-# ============================================================================
-# EXPORT RESULTS TO EXCEL
-# ============================================================================
-
-# Save all results to a multi-sheet Excel workbook
-with pd.ExcelWriter(out_xlsx, engine="openpyxl") as writer:
-    annual_results.to_excel(writer, sheet_name="Annual_Results", index=False)
-    cumulative_results.to_excel(writer, sheet_name="Cumulative_Results", index=False)
-    summary_df.to_excel(writer, sheet_name="Lifetime_Summary")
-
-print("Saved Excel:", out_xlsx)
-
 # ============================================================================
 # VISUALIZATION 1: ANNUAL EMISSIONS LINE PLOT
 # ============================================================================
 
 # Plot annual total emissions for all scenarios over time
-plt.figure(figsize=(10, 6))
+fig = plt.figure(figsize=(10, 6))
 for name in scenarios_defs.keys():
-    df_s = annual_results[annual_results["scenario"] == name]
+    df_s = scenario_frames[name]
     plt.plot(df_s["year"], df_s["total_kgCO2"], marker='o', linewidth=2, label=name.capitalize())
 
 plt.xlabel("Year")
@@ -263,7 +329,7 @@ plt.legend()
 if save_plots:
     plt.savefig(out_plot_annual)
     print("Saved annual line plot:", out_plot_annual)
-plt.show()
+plt.close(fig)
 
 # ============================================================================
 # VISUALIZATION 2: CUMULATIVE EMISSIONS LINE PLOT
@@ -286,7 +352,7 @@ ax.grid(alpha=0.25)
 if save_plots:
     plt.savefig(out_plot_cumulative)
     print("Saved cumulative plot:", out_plot_cumulative)
-plt.show()
+plt.close(fig)
 
 # ============================================================================
 # VISUALIZATION 3: COMPONENT BREAKDOWN BAR CHARTS
@@ -307,16 +373,15 @@ n_scenarios = len(scenario_names)
 bar_width = 0.14  # Width of each bar
 x = np.arange(len(years))  # X-axis positions for years
 
+# Horizontal offset of each scenario's bars within a year group
+offsets = (np.arange(n_scenarios) - n_scenarios/2) * bar_width + bar_width/2
+
 # Create grouped bar chart for each component
 for ax, (col, ylabel) in zip(axes, component_cols):
+    # Stack this component into an (n_scenarios, n_years) matrix once
+    component_matrix = np.stack([scenario_frames[name][col].to_numpy() for name in scenario_names])
     for i, name in enumerate(scenario_names):
-        # Get data for this scenario
-        df_s = annual_results[annual_results["scenario"] == name].set_index("year")
-        values = df_s[col].reindex(years).values
-        
-        # Offset bars horizontally to group by year
-        offset = (i - n_scenarios/2) * bar_width + bar_width/2
-        ax.bar(x + offset, values, width=bar_width, label=name.capitalize())
+        ax.bar(x + offsets[i], component_matrix[i], width=bar_width, label=name.capitalize(), rasterized=True)
     
     # Configure x-axis to show all year labels
     ax.set_xticks(x)
@@ -336,7 +401,7 @@ out_plot_components_all = f"CO2_components_bars_{timestamp}.png"
 if save_plots:
     plt.savefig(out_plot_components_all)
     print("Saved bar-component plot:", out_plot_components_all)
-plt.show()
+plt.close(fig)
 
 # ============================================================================
 # VISUALIZATION 4: STACKED BAR CHARTS PER SCENARIO
@@ -345,22 +410,26 @@ plt.show()
 # Create individual stacked bar charts showing emission breakdown for each scenario
 colors = ["#1f77b4", "#ff7f0e", "#2ca02c"]  # Manufacturing, Operational, EoL colors
 bar_width = 0.6
+x = np.arange(len(years))
+
+# All scenario charts share the same layout, so one figure is created and
+# redrawn for each scenario instead of initializing a new figure every time
+fig, ax = plt.subplots(figsize=(10, 5))
 
 for name in scenario_names:
-    # Get data for this scenario
-    df_s = annual_results[annual_results["scenario"] == name].set_index("year").reindex(years).fillna(0)
-    manuf = df_s["manufacturing_kgCO2"].values
-    oper = df_s["operational_kgCO2"].values
-    eol = df_s["eol_kgCO2"].values
+    # Get data for this scenario (build_scenario_df emits one row per year, in order)
+    df_s = scenario_frames[name]
+    manuf = df_s["manufacturing_kgCO2"].to_numpy()
+    oper = df_s["operational_kgCO2"].to_numpy()
+    eol = df_s["eol_kgCO2"].to_numpy()
     
-    # Create stacked bar chart
-    fig, ax = plt.subplots(figsize=(10, 5))
-    x = np.arange(len(years))
+    # Reset the shared axes before drawing this scenario
+    ax.clear()
     
     # Stack bars: manufacturing at bottom, operational in middle, EoL on top
-    p1 = ax.bar(x, manuf, width=bar_width, label="Manufacturing", color=colors[0])
-    p2 = ax.bar(x, oper, width=bar_width, bottom=manuf, label="Operational", color=colors[1])
-    p3 = ax.bar(x, eol, width=bar_width, bottom=manuf+oper, label="End-of-life", color=colors[2])
+    p1 = ax.bar(x, manuf, width=bar_width, label="Manufacturing", color=colors[0], rasterized=True)
+    p2 = ax.bar(x, oper, width=bar_width, bottom=manuf, label="Operational", color=colors[1], rasterized=True)
+    p3 = ax.bar(x, eol, width=bar_width, bottom=manuf+oper, label="End-of-life", color=colors[2], rasterized=True)
     
     # Configure axes
     ax.set_xticks(x)
@@ -375,9 +444,10 @@ for name in scenario_names:
     # Save individual scenario plot
     out_file = f"CO2_{name}_stacked_{timestamp}.png"
     if save_plots:
-        plt.savefig(out_file)
+        fig.savefig(out_file)
         print("Saved:", out_file)
-    plt.show()
+
+plt.close(fig)
 
 # ============================================================================
 # SENSITIVITY ANALYSIS: RENEWABLE SHARE vs SLEEP MODE
@@ -395,23 +465,18 @@ baseline_df = build_scenario_df("baseline", sleep_frac=0.0, renewable_share=0.0,
                                 manufacturing_spread_local=manufacturing_spread)
 baseline_lifetime = baseline_df["total_kgCO2"].sum()
 
-# Initialize grid to store lifetime emissions for each combination
-grid_lifetime = np.zeros((len(sleep_fracs), len(renewable_shares)))
-
-# Calculate lifetime emissions for each parameter combination
-for i, sf in enumerate(sleep_fracs):
-    for j, rs in enumerate(renewable_shares):
-        df_temp = build_scenario_df(
-            f"temp_sf{sf}_rs{rs}", 
-            sleep_frac=sf, 
-            renewable_share=rs,
-            manufacturing_spread_local=manufacturing_spread
-        )
-        grid_lifetime[i, j] = df_temp["total_kgCO2"].sum()
+# Lifetime emissions are linear in sleep_frac and renewable_share, so the whole
+# grid is evaluated in closed form rather than building one DataFrame per cell.
+# Rows = sleep fractions (17, 1), columns = renewable shares (1, 11)
+grid_lifetime = lifetime_emissions(
+    sleep_fracs[:, None],
+    renewable_shares[None, :],
+    manufacturing_spread_local=manufacturing_spread
+)
 
 # Calculate savings relative to baseline
-savings_pct = (baseline_lifetime - grid_lifetime) / baseline_lifetime * 100.0  # Percentage savings
 savings_abs = baseline_lifetime - grid_lifetime  # Absolute savings in kg CO2
+savings_pct = savings_abs * (100.0 / baseline_lifetime)  # Percentage savings
 
 # ============================================================================
 # VISUALIZATION 5: SAVINGS HEATMAP
@@ -443,7 +508,7 @@ ax.clabel(CS, inline=1, fontsize=8, fmt="%.0f%%")
 if save_plots:
     plt.savefig(out_plot_savings)
     print("Saved savings heatmap:", out_plot_savings)
-plt.show()
+plt.close(fig)
 
 # ============================================================================
 # EXTRACT KEY INSIGHTS FROM SENSITIVITY ANALYSIS
@@ -463,16 +528,11 @@ print(f"Lifetime CO2 at default sleep={sleep_fracs[idx_sf]:.2f}, renewables={ren
 print(f"Absolute savings (kg): {savings_abs[idx_sf, idx_rs]:,.0f} --> {savings_pct[idx_sf, idx_rs]:.1f}%")
 
 # Create DataFrame with absolute savings for all combinations
-savings_df = pd.DataFrame(savings_abs, 
-                          index=np.round(sleep_fracs, 3), 
-                          columns=np.round(renewable_shares, 3))
-savings_df.index.name = "sleep_frac"
-savings_df.columns.name = "renewable_share"
-
-# Append savings grid to Excel file
-with pd.ExcelWriter(out_xlsx, engine="openpyxl", mode="a") as writer:
-    savings_df.to_excel(writer, sheet_name="Savings_kgCO2_grid")
-print("Appended savings grid to Excel:", out_xlsx)
+savings_grid_df = pd.DataFrame(savings_abs, 
+                               index=np.round(sleep_fracs, 3), 
+                               columns=np.round(renewable_shares, 3))
+savings_grid_df.index.name = "sleep_frac"
+savings_grid_df.columns.name = "renewable_share"
 
 # ============================================================================
 # COMPARATIVE SAVINGS ANALYSIS
@@ -481,17 +541,8 @@ print("Appended savings grid to Excel:", out_xlsx)
 # Compare key scenarios directly to baseline to quantify savings potential
 compare_keys = ["baseline", "mixed", "renewable", "sleep", "sleep+renewable"]
 
-# Calculate lifetime totals for comparison scenarios
-lifetime_totals = {}
-for key in compare_keys:
-    params = scenarios_defs.get(key)
-    df_key = build_scenario_df(
-        key, 
-        sleep_frac=params["sleep_frac"],
-        renewable_share=params["renewable_share"],
-        manufacturing_spread_local=manufacturing_spread
-    )
-    lifetime_totals[key] = df_key["total_kgCO2"].sum()
+# Lifetime totals for comparison scenarios were already computed in summary_df
+lifetime_totals = summary_df.loc[compare_keys, "total_life_kgCO2"].to_dict()
 
 baseline_total = lifetime_totals["baseline"]
 
@@ -518,7 +569,7 @@ savings_df = savings_df.sort_values("savings_kgCO2", ascending=False)
 
 # Create bar chart showing absolute savings compared to baseline
 fig, ax = plt.subplots(figsize=(10, 6))
-bars = ax.bar(savings_df.index, savings_df["savings_kgCO2"], color="seagreen")
+bars = ax.bar(savings_df.index, savings_df["savings_kgCO2"], color="seagreen", rasterized=True)
 
 # Annotate each bar with absolute and percentage savings
 for rect, scen in zip(bars, savings_df.index):
@@ -539,16 +590,22 @@ out_plot_savings_simple = f"CO2_savings_simple_{timestamp}.png"
 if save_plots:
     plt.savefig(out_plot_savings_simple)
     print("Saved savings plot:", out_plot_savings_simple)
-plt.show()
+plt.close(fig)
 
 # ============================================================================
-# FINAL EXCEL EXPORT
+# EXPORT RESULTS TO EXCEL
 # ============================================================================
 
-# Add sorted savings comparison to Excel workbook
-with pd.ExcelWriter(out_xlsx, engine="openpyxl", mode="a") as writer:
+# Write every results table to the multi-sheet workbook in a single pass.
+# xlsxwriter is write-only, so the workbook is never re-opened and re-parsed.
+with pd.ExcelWriter(out_xlsx, engine="xlsxwriter") as writer:
+    annual_results.to_excel(writer, sheet_name="Annual_Results", index=False)
+    cumulative_results.to_excel(writer, sheet_name="Cumulative_Results", index=False)
+    summary_df.to_excel(writer, sheet_name="Lifetime_Summary")
+    savings_grid_df.to_excel(writer, sheet_name="Savings_kgCO2_grid")
     savings_df.to_excel(writer, sheet_name="Savings_Sorted")
-print("Added sorted savings table to Excel:", out_xlsx)
+
+print("Saved Excel:", out_xlsx)
 
 # ============================================================================
 # SUMMARY OF OUTPUT FILES